@@ -0,0 +1,9 @@
+"""
+This module holds the network clients shared across the research agent, so every
+module reuses the same connection pools instead of creating its own clients.
+"""
+from tavily import AsyncTavilyClient
+
+# Single Tavily client for the whole process; it keeps one persistent, pooled
+# HTTP connection so repeated searches reuse connections instead of re-handshaking
+tavily_client = AsyncTavilyClient()
@@ -1,27 +1,33 @@
 """
 This module stores the structured output schemas for the LLM output.
+
+The schemas are TypedDicts so that structured output is returned as plain dicts,
+without building and running Pydantic validators on every LLM call.
 """
-from pydantic import BaseModel, Field
+from typing_extensions import Annotated, TypedDict
 
-class ClarifyWithUser(BaseModel):
-    """Schema for user clarification decisions during scoping phase."""
-    need_clarification: bool = Field(
-        description="Whether the user needs to be asked a clarifying question.",
-    )
-    question: str = Field(
-        description="A question to ask the user to clarify the report scope",
-    )
-    verification: str = Field(
-        description="Verify message that we will start research after the user has provided the necessary information.",
-    )
+class ClarifyOrBrief(TypedDict):
+    """Schema for user clarification decisions during scoping phase, with the research brief when no clarification is needed."""
+    need_clarification: Annotated[
+        bool, ..., "Whether the user needs to be asked a clarifying question."
+    ]
+    question: Annotated[
+        str, ..., "A question to ask the user to clarify the report scope"
+    ]
+    verification: Annotated[
+        str, ..., "Verify message that we will start research after the user has provided the necessary information."
+    ]
+    research_brief: Annotated[
+        str, ..., "A research question that will be used to guide the research. Empty if clarification is needed."
+    ]
 
-class ResearchQuestion(BaseModel):
+class ResearchQuestion(TypedDict):
     """Schema for research brief generation."""
-    research_brief: str = Field(
-        description="A research question that will be used to guide the research.",
-    )
+    research_brief: Annotated[
+        str, ..., "A research question that will be used to guide the research."
+    ]
 
-class Summary(BaseModel):
+class Summary(TypedDict):
     """Schema for webpage content summarization."""
-    summary: str = Field(description="Concise summary of the webpage content")
-    key_excerpts: str = Field(description="Important quotes and excerpts from the content")
\ No newline at end of file
+    summary: Annotated[str, ..., "Concise summary of the webpage content"]
+    key_excerpts: Annotated[str, ..., "Important quotes and excerpts from the content"]
@@ -0,0 +1,53 @@
+"""
+This module provides a pool of chat models spread across several OpenAI-compatible endpoints,
+so that concurrent research sessions don't all queue up behind a single deployment.
+"""
+import os
+import zlib
+from functools import lru_cache
+
+from langchain.chat_models import init_chat_model
+
+class ModelPool:
+    """
+    Pool of equivalent chat models, one per endpoint.
+    
+    Endpoints are read from the comma-separated OPENAI_BASE_URLS environment variable; when it is
+    not set the pool holds a single model using the default endpoint (OPENAI_BASE_URL).
+    Requests are sharded by a stable hash of a key (e.g. the research brief), so the same prompts
+    always hit the same server and can reuse its prompt cache, while different sessions are
+    spread across all endpoints.
+    """
+
+    def __init__(self, models: list):
+        self.models = models
+
+    @classmethod
+    def from_model(cls, model: str, **kwargs) -> "ModelPool":
+        """Initialize the given model once for every configured endpoint."""
+        base_urls = [url.strip() for url in os.getenv("OPENAI_BASE_URLS", "").split(",") if url.strip()]
+        if not base_urls:
+            return cls([init_chat_model(model=model, **kwargs)])
+        return cls([init_chat_model(model=model, base_url=base_url, **kwargs) for base_url in base_urls])
+
+    def for_key(self, key: str):
+        """Get the model responsible for the given key."""
+        return self.models[zlib.crc32(key.encode()) % len(self.models)]
+
+    def bind_tools(self, tools: list) -> "ModelPool":
+        """Get a pool of the same models with the given tools bound."""
+        return ModelPool([model.bind_tools(tools) for model in self.models])
+
+    def with_structured_output(self, schema) -> "ModelPool":
+        """Get a pool of the same models returning structured output for the given schema."""
+        return ModelPool([model.with_structured_output(schema) for model in self.models])
+
+@lru_cache(maxsize=None)
+def get_model(model: str, **kwargs) -> ModelPool:
+    """
+    Get the shared model pool for the given model and settings.
+    
+    Models are initialized lazily on first use rather than at import time, and every
+    caller asking for the same model and settings shares the same pool (and HTTP clients).
+    """
+    return ModelPool.from_model(model, **kwargs)
@@ -4,7 +4,48 @@ This module contains all prompt templates used across the research workflow comp
 including user clarification, research brief generation, and report synthesis.
 """
 
-clarify_with_user_instructions="""
+# Guidelines for turning the conversation into a research brief, shared by the prompts that write one
+research_brief_guidelines = """Guidelines:
+1. Maximize Specificity and Detail
+- Include all known user preferences and explicitly list key attributes or dimensions to consider.
+- It is important that all details from the user are included in the instructions.
+
+2. Handle Unstated Dimensions Carefully
+- When research quality requires considering additional dimensions that the user hasn't specified, acknowledge them as open considerations rather than assumed preferences.
+- Example: Instead of assuming "budget-friendly options," say "consider all price ranges unless cost constraints are specified."
+- Only mention dimensions that are genuinely necessary for comprehensive research in that domain.
+
+3. Avoid Unwarranted Assumptions
+- Never invent specific user preferences, constraints, or requirements that weren't stated.
+- If the user hasn't provided a particular detail, explicitly note this lack of specification.
+- Guide the researcher to treat unspecified aspects as flexible rather than making assumptions.
+
+4. Distinguish Between Research Scope and User Preferences
+- Research scope: What topics/dimensions should be investigated (can be broader than user's explicit mentions)
+- User preferences: Specific constraints, requirements, or preferences (must only include what user stated)
+- Example: "Research coffee quality factors (including bean sourcing, roasting methods, brewing techniques) for San Francisco coffee shops, with primary focus on taste as specified by the user."
+
+5. Use the First Person
+- Phrase the request from the perspective of the user.
+
+6. Sources
+- If specific sources should be prioritized, specify them in the research question.
+- For product and travel research, prefer linking directly to official or primary websites (e.g., official brand sites, manufacturer pages, or reputable e-commerce platforms like Amazon for user reviews) rather than aggregator sites or SEO-heavy blogs.
+- For academic or scientific queries, prefer linking directly to the original paper or official journal publication rather than survey papers or secondary summaries.
+- For people, try linking directly to their LinkedIn profile, or their personal website if they have one.
+- If the query is in a specific language, prioritize sources published in that language.
+
+<Safety Guardrails>
+**OPENAI POLICY COMPLIANCE**:
+- Do NOT generate research questions that could be used for political campaigning, voter suppression, or spreading misinformation.
+- Avoid inflammatory, biased, or non-neutral language.
+- If the user's request involves sensitive or political topics, frame the research question in a strictly objective, factual, and non-partisan manner.
+- Focus on data-driven research and public records.
+- Ensure the question does not violate OpenAI's usage policies regarding harmful content, harassment, or illegal activities.
+</Safety Guardrails>
+"""
+
+clarify_or_write_research_brief_prompt="""
 These are the messages that have been exchanged so far from the user asking for the report. Use these as context for your clarification. If the user does off-topic, guide them back to the topic and use these messages as context:
 <Messages>
 {messages}
@@ -41,23 +82,31 @@ If you need to ask a question, follow these guidelines:
 Respond in valid JSON format with these exact keys:
 "need_clarification": boolean,
 "question": "<question to ask the user to clarify the report scope>",
-"verification": "<verification message that we will start research>"
+"verification": "<verification message that we will start research>",
+"research_brief": "<research question that will be used to guide the research>"
 
 If you need to ask a clarifying question, return:
 "need_clarification": true,
 "question": "<your clarifying question>",
-"verification": ""
+"verification": "",
+"research_brief": ""
 
 If you do not need to ask a clarifying question, return:
 "need_clarification": false,
 "question": "",
-"verification": "<acknowledgement message that you will now start research based on the provided information>"
+"verification": "<acknowledgement message that you will now start research based on the provided information>",
+"research_brief": "<a single, detailed research question written from the messages, following the research brief guidelines below>"
 
 For the verification message when no clarification is needed:
 - Acknowledge that you have sufficient information to proceed
 - Briefly summarize the key aspects of what you understand from their request
 - Confirm that you will now begin the research process
 - Keep the message concise and professional
+
+<Research Brief Guidelines>
+The research brief translates the messages into a more detailed and concrete research question that will be used to guide the research.
+
+""" + research_brief_guidelines + """</Research Brief Guidelines>
 """
 
 transform_messages_into_research_topic_prompt = """You will be given a set of messages that have been exchanged so far between yourself and the user. 
@@ -72,45 +121,7 @@ Today's date is {date}.
 
 You will return a single research question that will be used to guide the research.
 
-Guidelines:
-1. Maximize Specificity and Detail
-- Include all known user preferences and explicitly list key attributes or dimensions to consider.
-- It is important that all details from the user are included in the instructions.
-
-2. Handle Unstated Dimensions Carefully
-- When research quality requires considering additional dimensions that the user hasn't specified, acknowledge them as open considerations rather than assumed preferences.
-- Example: Instead of assuming "budget-friendly options," say "consider all price ranges unless cost constraints are specified."
-- Only mention dimensions that are genuinely necessary for comprehensive research in that domain.
-
-3. Avoid Unwarranted Assumptions
-- Never invent specific user preferences, constraints, or requirements that weren't stated.
-- If the user hasn't provided a particular detail, explicitly note this lack of specification.
-- Guide the researcher to treat unspecified aspects as flexible rather than making assumptions.
-
-4. Distinguish Between Research Scope and User Preferences
-- Research scope: What topics/dimensions should be investigated (can be broader than user's explicit mentions)
-- User preferences: Specific constraints, requirements, or preferences (must only include what user stated)
-- Example: "Research coffee quality factors (including bean sourcing, roasting methods, brewing techniques) for San Francisco coffee shops, with primary focus on taste as specified by the user."
-
-5. Use the First Person
-- Phrase the request from the perspective of the user.
-
-6. Sources
-- If specific sources should be prioritized, specify them in the research question.
-- For product and travel research, prefer linking directly to official or primary websites (e.g., official brand sites, manufacturer pages, or reputable e-commerce platforms like Amazon for user reviews) rather than aggregator sites or SEO-heavy blogs.
-- For academic or scientific queries, prefer linking directly to the original paper or official journal publication rather than survey papers or secondary summaries.
-- For people, try linking directly to their LinkedIn profile, or their personal website if they have one.
-- If the query is in a specific language, prioritize sources published in that language.
-
-<Safety Guardrails>
-**OPENAI POLICY COMPLIANCE**:
-- Do NOT generate research questions that could be used for political campaigning, voter suppression, or spreading misinformation.
-- Avoid inflammatory, biased, or non-neutral language.
-- If the user's request involves sensitive or political topics, frame the research question in a strictly objective, factual, and non-partisan manner.
-- Focus on data-driven research and public records.
-- Ensure the question does not violate OpenAI's usage policies regarding harmful content, harassment, or illegal activities.
-</Safety Guardrails>
-"""
+""" + research_brief_guidelines
 
 research_agent_prompt =  """You are a research assistant conducting research on the user's input topic. For context, today's date is {date}.
 
@@ -2,13 +2,26 @@
 The fields of the state. This module makes it easier to maintain structure on data being passed through agentic workflows
 """
 
-import operator
 from typing_extensions import Annotated, List, Sequence, TypedDict
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph import MessagesState
 from langgraph.graph.message import add_messages
 
+def add_notes(left: list[str], right: list[str]) -> list[str]:
+    """
+    Reducer for note lists that only copies when both sides hold notes.
+
+    LangGraph shares a channel's value between channel copies and checkpoints, so the
+    existing list is never extended in place. Instead, an empty side is returned as-is,
+    which avoids copying the whole list for empty updates and for the first batch of notes.
+    """
+    if not right:
+        return left
+    if not left:
+        return right
+    return left + right
+
 class AgentInputState(MessagesState):
     """Input state for the general agent workflow - only contains messages from user input."""
     pass
@@ -27,7 +40,7 @@ class AgentState(MessagesState):
     # Messages exchanged with the supervisor agent for coordination
     supervisor_messages: Annotated[Sequence[BaseMessage], add_messages]
     # Processed and structured notes ready for report generation
-    notes: Annotated[list[str], operator.add] = []
+    notes: Annotated[list[str], add_notes] = []
     # Final formatted research report
     final_report: str
 
@@ -42,6 +55,8 @@ class ResearchScopeState(MessagesState):
 
     # Research brief generated from user conversation history
     research_brief: str
+    # Buffer string of the conversation, built once by clarify_with_user and reused by write_research_brief
+    messages_buffer: str
 
 class ResearchExecutionState(MessagesState):
     """
@@ -55,7 +70,7 @@ class ResearchExecutionState(MessagesState):
     # Messages exchanged with the supervisor agent for coordination
     supervisor_messages: Annotated[Sequence[BaseMessage], add_messages]
     # Processed and structured notes ready for report generation
-    notes: Annotated[list[str], operator.add] = []
+    notes: Annotated[list[str], add_notes] = []
     # Final formatted research report
     final_report: str
 
@@ -94,6 +109,8 @@ class SupervisorState(TypedDict):
     # Detailed research brief that guides the overall research direction
     research_brief: str
     # Processed and structured notes ready for final report generation
-    notes: Annotated[list[str], operator.add] = []
+    notes: Annotated[list[str], add_notes] = []
+    # Content of every tool message produced so far, collected as the tools run
+    tool_notes: Annotated[list[str], add_notes] = []
     # Counter tracking the number of research iterations performed
     research_iterations: int = 0
\ No newline at end of file
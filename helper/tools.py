@@ -7,11 +7,11 @@ including search/summarization tool and thinking tool.
 from pydantic import BaseModel
 from langchain_core.tools import tool
 
-from helper.utils import tavily_search_multiple, deduplicate_search_results, process_search_results, format_search_output
+from helper.utils import tavily_search_multiple, deduplicate_and_process_search_results, format_search_output
 
 
 @tool
-def tavily_search(
+async def tavily_search(
     query: str,
 ) -> str:
     """Fetch results from Tavily search API with content summarization.
@@ -23,18 +23,15 @@ def tavily_search(
         Formatted string of search results with summaries
     """
     # Execute search for single query
-    search_results = tavily_search_multiple(
+    search_results = await tavily_search_multiple(
         [query],  # Convert single query to list for the internal function
         max_results=3,
         topic="general",
         include_raw_content=True,
     )
 
-    # Deduplicate results by URL to avoid processing duplicate content
-    unique_results = deduplicate_search_results(search_results)
-
-    # Process results with summarization
-    summarized_results = process_search_results(unique_results)
+    # Deduplicate results by URL and process them with summarization in one pass
+    summarized_results = await deduplicate_and_process_search_results(search_results)
 
     # Format output for consumption
     return format_search_output(summarized_results)
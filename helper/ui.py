@@ -6,46 +6,66 @@ terminal formatting using the `rich` library.
 
 from rich.console import Console
 from rich.panel import Panel
+from rich.style import Style
 from rich.text import Text
 from rich.table import Table
 from rich import print as rprint
 
 console = Console()
 
+# Styles and fixed labels are built once at import rather than parsing markup on every call
+magenta_style = Style(color="magenta")
+bold_magenta_style = Style(color="magenta", bold=True)
+green_style = Style(color="green")
+cyan_style = Style(color="cyan")
+white_style = Style(color="white")
+italic_white_style = Style(color="white", italic=True)
+
+status_prefix = Text("➤ ", style=cyan_style)
+research_brief_title = Text("💼 Research Brief", style=Style(color="green", bold=True))
+final_report_title = Text("📊 Final Research Report", style=Style(color="cyan", bold=True))
+ai_question_label = Text("Agent: ", style=Style(color="yellow", bold=True))
+error_label = Text("ERROR: ", style=Style(color="red", bold=True))
+research_topics_header = Text(
+    "\nLead Researchers (Supervisors) has created the following research topics:",
+    style=Style(color="blue", bold=True)
+)
+research_topic_number_style = Style(color="blue", bold=True)
+
 class UI:
     """Utility class for terminal formatting."""
     
     @staticmethod
     def print_section_header(title: str):
         """Print a visually prominent section header."""
-        console.print(Panel(Text(title, style="bold magenta"), border_style="magenta"))
+        console.print(Panel(Text(title, style=bold_magenta_style), border_style=magenta_style))
 
     @staticmethod
     def print_status(message: str):
         """Print a status update message."""
-        console.print(f"[cyan]➤[/cyan] [italic white]{message}[/italic white]")
+        console.print(Text.assemble(status_prefix, (message, italic_white_style)))
 
     @staticmethod
     def print_research_brief(brief: str):
         """Print the research brief in a nice panel."""
         console.print(Panel(
-            Text(brief, style="white"),
-            title="[bold green]💼 Research Brief[/bold green]",
-            border_style="green"
+            Text(brief, style=white_style),
+            title=research_brief_title,
+            border_style=green_style
         ))
 
     @staticmethod
     def print_ai_question(question: str):
         """Print a question from the AI to the user."""
-        console.print(f"[bold yellow]Agent:[/bold yellow] {question}")
+        console.print(Text.assemble(ai_question_label, question))
 
     @staticmethod
     def print_research_topics(topics: list[str]):
         """Print research topics created by the supervisor."""
-        console.print("\n[bold blue]Lead Researchers (Supervisors) has created the following research topics:[/bold blue]")
+        console.print(research_topics_header)
         table = Table(show_header=False, box=None, padding=(0, 1))
         for i, topic in enumerate(topics, 1):
-            table.add_row(f"[bold blue]{i}.[/bold blue]", f"[white]{topic}[/white]")
+            table.add_row(Text(f"{i}.", style=research_topic_number_style), Text(topic, style=white_style))
         console.print(table)
         console.print("") # Add a newline for spacing
 
@@ -53,12 +73,12 @@ class UI:
     def print_final_report(report: str):
         """Print the final research report."""
         console.print(Panel(
-            Text(report, style="white"),
-            title="[bold cyan]📊 Final Research Report[/bold cyan]",
-            border_style="cyan"
+            Text(report, style=white_style),
+            title=final_report_title,
+            border_style=cyan_style
         ))
 
     @staticmethod
     def print_error(message: str):
         """Print an error message."""
-        console.print(f"[bold red]ERROR:[/bold red] {message}")
\ No newline at end of file
+        console.print(Text.assemble(error_label, message))
@@ -2,28 +2,70 @@
 This module provides search and content processing utilities for the research agent,
 including web search capabilities and content summarization tools.
 """
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import date
 
 from typing_extensions import List, Literal
 
 from langchain_core.messages import HumanMessage, BaseMessage, filter_messages
 from langchain_core.runnables import RunnableConfig
-from langchain.chat_models import init_chat_model
-from tavily import TavilyClient
 
+from helper.clients import tavily_client
 from helper.llm_output_schema_config import Summary
+from helper.model_pool import ModelPool, get_model
 from helper.prompts import summarize_webpage_prompt
 from helper.ui import UI
 
-# Initialize Tavily client
-tavily_client = TavilyClient()
+# Maximum number of webpages summarized at the same time (shared across all researchers)
+# This keeps concurrent summarization from running into LLM rate limits
+max_concurrent_summaries = 8
+summarization_semaphore = asyncio.Semaphore(max_concurrent_summaries)
+
+# Raw content at or below this length is passed through as-is instead of being summarized
+summarize_threshold_chars = 8000
+
+
+# Webpage summaries keyed by a hash of the page content, so pages seen again
+# (mirrors, aggregators, repeated queries) are not re-summarized
+# The least recently used summaries are evicted once the cache is full
+max_cached_summaries = 1024
+summary_cache: OrderedDict[bytes, str] = OrderedDict()
+
+# Tavily responses keyed by query and search options, reused for search_cache_ttl seconds
+# Entries are kept in insertion order; the oldest are evicted once the cache is full
+search_cache_ttl = 1800
+max_cached_searches = 256
+search_cache: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+
+# Matches everything up to and including the last sentence ending (". ", "! " or "? ").
+# The greedy prefix makes the regex engine scan backwards from the end of the text,
+# so the last sentence boundary is found in a single pass
+last_sentence_end_pattern = re.compile(r".*[.!?] ", re.DOTALL)
+
+# Separator line printed after each source in the formatted search output
+source_separator = "-" * 80 + "\n"
+
+@lru_cache(maxsize=1)
+def get_summarization_model() -> ModelPool:
+    """Get the structured summarization model, built once on first use and shared by every summarization."""
+    return get_model("openai:gpt-5-mini").with_structured_output(Summary)
+
+@lru_cache(maxsize=1)
+def format_date(day: date) -> str:
+    """Format a date in a human-readable format (cached, so it is only formatted once per day)."""
+    return day.strftime("%a %b %-d, %Y")
 
 def get_today_str() -> str:
     """Get current date in a human-readable format."""
-    return datetime.now().strftime("%a %b %-d, %Y")
+    return format_date(date.today())
     
-def tavily_search_multiple(
+async def tavily_search_multiple(
     search_queries: List[str], 
     max_results: int = 3, 
     topic: Literal["general", "news", "finance"] = "general", 
@@ -31,6 +73,9 @@ def tavily_search_multiple(
 ) -> List[dict]:
     """Perform search using Tavily API for multiple queries.
 
+    All queries are issued concurrently, so the total latency is roughly that
+    of the slowest single query rather than the sum of all of them.
+
     Args:
         search_queries: List of search queries to execute
         max_results: Maximum number of results per query
@@ -38,21 +83,51 @@ def tavily_search_multiple(
         include_raw_content: Whether to include raw webpage content
 
     Returns:
-        List of search result dictionaries
+        List of search result dictionaries (failed queries are skipped)
     """
-    
-    # Execute searches sequentially. Note: yon can use AsyncTavilyClient to parallelize this step.
-    search_docs = []
-    for query in search_queries:
-        result = tavily_client.search(
-            query,
-            max_results=max_results,
-            include_raw_content=include_raw_content,
-            topic=topic
-        )
-        search_docs.append(result)
+    now = time.monotonic()
+
+    # Drop expired responses (entries are ordered by insertion time, so the oldest come first)
+    while search_cache and next(iter(search_cache.values()))[0] + search_cache_ttl <= now:
+        search_cache.popitem(last=False)
+
+    cache_keys = [(query, max_results, topic, include_raw_content) for query in search_queries]
+
+    # Responses available to this call, checked against their own timestamp
+    responses = {}
+    for key in dict.fromkeys(cache_keys):
+        cached = search_cache.get(key)
+        if cached and cached[0] + search_cache_ttl > now:
+            responses[key] = cached[1]
+    uncached_keys = [key for key in dict.fromkeys(cache_keys) if key not in responses]
+
+    results = await asyncio.gather(
+        *(
+            tavily_client.search(
+                query,
+                max_results=max_results,
+                include_raw_content=include_raw_content,
+                topic=topic
+            )
+            for query, _, _, _ in uncached_keys
+        ),
+        return_exceptions=True,
+    )
 
-    return search_docs
+    # Timestamp new responses when they arrive, so insertion order stays in time order
+    fetched_at = time.monotonic()
+    for key, result in zip(uncached_keys, results):
+        if isinstance(result, Exception):
+            UI.print_error(f"Search failed for query '{key[0]}': {str(result)}")
+            continue
+        responses[key] = result
+        search_cache.pop(key, None)
+        search_cache[key] = (fetched_at, result)
+
+    while len(search_cache) > max_cached_searches:
+        search_cache.popitem(last=False)
+
+    return [responses[key] for key in cache_keys if key in responses]
 
 def truncate_content_by_tokens(content: str, max_tokens: int = 6000) -> str:
     """Truncate content to stay within token limits.
@@ -73,19 +148,43 @@ def truncate_content_by_tokens(content: str, max_tokens: int = 6000) -> str:
     # Try to truncate at sentence boundaries
     truncated = content[:max_chars]
     
-    # Find the last sentence ending
-    last_period = truncated.rfind('. ')
-    last_exclamation = truncated.rfind('! ')
-    last_question = truncated.rfind('? ')
+    # Find the last sentence ending, only looking past the 80% mark to ensure we keep most of the content
+    last_sentence_end = last_sentence_end_pattern.match(truncated, int(max_chars * 0.8) + 1)
     
-    last_sentence_end = max(last_period, last_exclamation, last_question)
-    
-    if last_sentence_end > max_chars * 0.8:  # Ensure we keep most of the content
-        return truncated[:last_sentence_end + 1]
+    if last_sentence_end:
+        return truncated[:last_sentence_end.end() - 1]
     else:
         return truncated + "..."
 
-def summarize_webpage_content(webpage_content: str) -> str:
+def truncate_notes_by_tokens(notes: list[str], max_tokens: int) -> list[str]:
+    """Keep the most recent notes that fit within a token budget.
+    
+    Notes are taken newest first. A note that does not fit in the remaining budget is
+    skipped, except the newest note, which is truncated so the findings are never empty.
+    
+    Args:
+        notes: Research notes, oldest first
+        max_tokens: Maximum total tokens to keep across all notes
+        
+    Returns:
+        The kept notes, in their original order
+    """
+    # Rough estimation: 1 token ≈ 4 characters
+    remaining_chars = max_tokens * 4
+    
+    kept_notes = []
+    for note in reversed(notes):
+        if len(note) <= remaining_chars:
+            kept_notes.append(note)
+            remaining_chars -= len(note)
+        elif not kept_notes:
+            kept_notes.append(truncate_content_by_tokens(note, max_tokens))
+            remaining_chars = 0
+    
+    kept_notes.reverse()
+    return kept_notes
+
+async def summarize_webpage_content(webpage_content: str) -> str:
     """Summarize webpage content using the configured summarization model.
     
     Args:
@@ -94,17 +193,17 @@ def summarize_webpage_content(webpage_content: str) -> str:
     Returns:
         Formatted summary with key excerpts
     """
-    try:
-        summarization_model = init_chat_model(model="openai:gpt-5-mini")
+    cache_key = hashlib.blake2b(webpage_content.encode(), digest_size=16).digest()
+    if cache_key in summary_cache:
+        summary_cache.move_to_end(cache_key)
+        return summary_cache[cache_key]
 
+    try:
         # Truncate content to stay within token limits
         truncated_content = truncate_content_by_tokens(webpage_content, max_tokens=100000)
 
-        # Set up structured output model for summarization
-        structured_model = summarization_model.with_structured_output(Summary)
-        
         # Generate summary
-        summary = structured_model.invoke([
+        summary = await get_summarization_model().for_key(webpage_content).ainvoke([
             HumanMessage(content=summarize_webpage_prompt.format(
                 webpage_content=truncated_content, 
                 date=get_today_str()
@@ -113,60 +212,70 @@ def summarize_webpage_content(webpage_content: str) -> str:
         
         # Format summary with clear structure
         formatted_summary = (
-            f"<summary>\n{summary.summary}\n</summary>\n\n"
-            f"<key_excerpts>\n{summary.key_excerpts}\n</key_excerpts>"
+            f"<summary>\n{summary['summary']}\n</summary>\n\n"
+            f"<key_excerpts>\n{summary['key_excerpts']}\n</key_excerpts>"
         )
         
-        return formatted_summary
-        
     except Exception as e:
         UI.print_error(f"Failed to summarize webpage: {str(e)}")
         return webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
 
-def deduplicate_search_results(search_results: List[dict]) -> dict:
-    """Deduplicate search results by URL to avoid processing duplicate content.
+    # Only successful summaries are cached, so failures are retried next time
+    summary_cache[cache_key] = formatted_summary
+    if len(summary_cache) > max_cached_summaries:
+        summary_cache.popitem(last=False)
+
+    return formatted_summary
+
+async def deduplicate_and_process_search_results(search_results: List[dict]) -> dict:
+    """Deduplicate search results by URL and summarize content where available.
+
+    Deduplication and processing happen in a single pass: each result is scheduled
+    for processing the first time its URL is seen, and duplicates are skipped.
+    Pages whose raw content is no longer than summarize_threshold_chars are kept
+    verbatim. Longer webpages are summarized concurrently (at most max_concurrent_summaries at a time).
     
     Args:
         search_results: List of search result dictionaries
         
     Returns:
-        Dictionary mapping URLs to unique results
+        Dictionary mapping unique URLs to processed results with summaries
     """
-    unique_results = {}
-    
-    for response in search_results:
-        for result in response['results']:
-            url = result['url']
-            if url not in unique_results:
-                unique_results[url] = result
-    
-    return unique_results
+    async def process_result(result: dict) -> dict:
+        raw_content = result.get("raw_content")
 
-def process_search_results(unique_results: dict) -> dict:
-    """Process search results by summarizing content where available.
-    
-    Args:
-        unique_results: Dictionary of unique search results
-        
-    Returns:
-        Dictionary of processed results with summaries
-    """
-    summarized_results = {}
-    
-    for url, result in unique_results.items():
         # Use existing content if no raw content for summarization
-        if not result.get("raw_content"):
+        if not raw_content:
             content = result['content']
+        # Short pages already fit comfortably in context, so skip the LLM round-trip
+        elif len(raw_content) <= summarize_threshold_chars:
+            content = raw_content
         else:
             # Summarize raw content for better processing
-            content = summarize_webpage_content(result['raw_content'])
-        
-        summarized_results[url] = {
+            async with summarization_semaphore:
+                content = await summarize_webpage_content(raw_content)
+
+        return {
             'title': result['title'],
             'content': content
         }
-    
-    return summarized_results
+
+    seen_urls = set()
+    urls = []
+    coros = []
+
+    for response in search_results:
+        for result in response['results']:
+            url = result['url']
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            urls.append(url)
+            coros.append(process_result(result))
+
+    processed_results = await asyncio.gather(*coros)
+
+    return dict(zip(urls, processed_results))
 
 def format_search_output(summarized_results: dict) -> str:
     """Format search results into a well-structured string output.
@@ -180,15 +289,15 @@ def format_search_output(summarized_results: dict) -> str:
     if not summarized_results:
         return "No valid search results found. Please try different search queries or use a different search API."
     
-    formatted_output = "Search results: \n\n"
+    output_parts = ["Search results: \n\n"]
     
     for i, (url, result) in enumerate(summarized_results.items(), 1):
-        formatted_output += f"\n\n--- SOURCE {i}: {result['title']} ---\n"
-        formatted_output += f"URL: {url}\n\n"
-        formatted_output += f"SUMMARY:\n{result['content']}\n\n"
-        formatted_output += "-" * 80 + "\n"
+        output_parts.append(f"\n\n--- SOURCE {i}: {result['title']} ---\n")
+        output_parts.append(f"URL: {url}\n\n")
+        output_parts.append(f"SUMMARY:\n{result['content']}\n\n")
+        output_parts.append(source_separator)
     
-    return formatted_output
+    return "".join(output_parts)
 
 def get_notes_from_tool_calls(messages: list[BaseMessage]) -> list[str]:
     """Extract research notes from ToolMessage objects in supervisor message history.
@@ -198,6 +307,10 @@ def get_notes_from_tool_calls(messages: list[BaseMessage]) -> list[str]:
     sub-agents via ConductResearch tool calls, each sub-agent returns its
     compressed findings as the content of a ToolMessage. This function
     extracts all such ToolMessage content to compile the final research notes.
+
+    The supervisor itself records tool message content in SupervisorState.tool_notes
+    as it goes, which avoids rescanning the whole history; this function remains
+    for callers that only have the message history.
     
     Args:
         messages: List of messages from supervisor's conversation history
@@ -18,7 +18,7 @@ Architecture:
 - Uses LangGraph for workflow management and state tracking
 - Implements async/await patterns for non-blocking execution
 - Maintains separate agent instances for different workflow phases
-- Uses InMemorySaver for state persistence within sessions
+- Uses InMemorySaver to persist the clarification conversation across user turns
 
 Usage:
     python main.py
@@ -29,13 +29,17 @@ from initial scoping to final report generation.
 
 import asyncio
 
+from dotenv import load_dotenv
+
+# Load environment variables before importing the phases, which read them at import time
+load_dotenv()
+
 from langgraph.graph import StateGraph, START, END
 from langchain_core.messages import HumanMessage
 from langgraph.checkpoint.memory import InMemorySaver
 
 from phases.research_scope import clarify_with_user, write_research_brief
-from phases.research_execution.lead_researcher import supervisor_agent
-from phases.research_execution.writer import final_report_generation, save_final_report
+from phases.research_execution.writer import research_and_final_report_generation, save_final_report
 from helper.ui import UI
 
 from helper.state_config import ResearchScopeState, ResearchExecutionState, AgentInputState
@@ -44,9 +48,10 @@ from helper.state_config import ResearchScopeState, ResearchExecutionState, Agen
 research_brief_agent = None
 research_agent = None
 
-# Global checkpointers for state persistence across both phases
+# Global checkpointer for the clarification phase, which resumes the same thread on every user turn
+# The execution phase runs exactly once per session, so it is compiled without a checkpointer
+# to avoid snapshotting the state after every step
 research_scope_checkpointer = InMemorySaver()
-research_execution_checkpointer = InMemorySaver()
 
 def build_research_scope_graph():
     """
@@ -58,10 +63,11 @@ def build_research_scope_graph():
     - State management for the clarification phase
     
     The graph consists of two nodes:
-    1. 'clarify_with_user': Determines if clarification is needed and asks questions
-    2. 'write_research_brief': Generates comprehensive research brief
+    1. 'clarify_with_user': Determines if clarification is needed and asks questions,
+       or writes the research brief in the same LLM call when no clarification is needed
+    2. 'write_research_brief': Generates comprehensive research brief (fallback only)
     
-    Workflow: START → clarify_with_user → write_research_brief → END
+    Workflow: START → clarify_with_user → END (→ write_research_brief → END if no brief was written)
     
     Args:
         None
@@ -70,9 +76,13 @@ def build_research_scope_graph():
         None (compiles graph into global research_brief_agent variable)
         
     Side Effects:
-        Sets global research_brief_agent with compiled graph instance
+        Sets global research_brief_agent with compiled graph instance (only on the first call)
     """
     global research_brief_agent
+    # The compiled graph is reused for the rest of the process
+    if research_brief_agent is not None:
+        return
+
     agent_builder = StateGraph(ResearchScopeState, input_state=AgentInputState)
     agent_builder.add_node("clarify_with_user", clarify_with_user)
     agent_builder.add_node("write_research_brief", write_research_brief)
@@ -91,14 +101,15 @@ def build_research_execution_graph():
     
     This function creates a LangGraph workflow that handles:
     - Supervisor agent coordination for research tasks
-    - Final report generation from research findings
+    - Final report generation from research findings, drafted speculatively while research runs
     - Integration with researcher sub-agents for data collection
     
     The graph consists of two nodes:
-    1. 'supervisor_subgraph': Coordinates research execution and delegates tasks
-    2. 'final_report_generation': Synthesizes findings into final report
+    1. 'research_and_final_report_generation': Runs the supervisor subgraph, which coordinates
+       research execution and delegates tasks, and synthesizes findings into the final report
+    2. 'save_final_report': Saves the final report to cloud storage
     
-    Workflow: START → supervisor_subgraph → final_report_generation → END
+    Workflow: START → research_and_final_report_generation → save_final_report → END
     
     Args:
         None
@@ -107,22 +118,22 @@ def build_research_execution_graph():
         None (compiles graph into global research_agent variable)
         
     Side Effects:
-        Sets global research_agent with compiled graph instance
+        Sets global research_agent with compiled graph instance (only on the first call)
     """
     global research_agent
+    # The compiled graph is reused for the rest of the process
+    if research_agent is not None:
+        return
+
     agent_builder = StateGraph(ResearchExecutionState, input_state=AgentInputState)
-    agent_builder.add_node("supervisor_subgraph", supervisor_agent)
-    agent_builder.add_node("final_report_generation", final_report_generation)
+    agent_builder.add_node("research_and_final_report_generation", research_and_final_report_generation)
     agent_builder.add_node("save_final_report", save_final_report)
 
-    agent_builder.add_edge(START, "supervisor_subgraph")
-    agent_builder.add_edge("supervisor_subgraph", "final_report_generation")    
-    agent_builder.add_edge("final_report_generation", "save_final_report")
+    agent_builder.add_edge(START, "research_and_final_report_generation")
+    agent_builder.add_edge("research_and_final_report_generation", "save_final_report")
     agent_builder.add_edge("save_final_report", END)
 
-    # Checkpointer saves messages even after agent runs once
-    global research_execution_checkpointer
-    research_agent = agent_builder.compile(checkpointer=research_execution_checkpointer)
+    research_agent = agent_builder.compile()
 
 async def execute_research_scope_phase():
     """
@@ -178,7 +189,7 @@ async def execute_research_phase(research_brief: str):
         Independent from scope clarification phase
         
     State Flow:
-        Research brief → supervisor_subgraph → final_report_generation → result
+        Research brief → research_and_final_report_generation → save_final_report → result
     """
     # Use dedicated thread for research execution phase
     thread = {"configurable": {"thread_id": "research_execution_thread", "recursion_limit": 50}}
@@ -7,10 +7,10 @@ This module implements a supervisor pattern where:
 """
 
 import asyncio
+from functools import lru_cache
 
 from typing_extensions import Literal
 
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import (
     HumanMessage, 
     SystemMessage, 
@@ -24,14 +24,15 @@ from phases.research_execution.researcher import researcher_agent
 from helper.state_config import SupervisorState
 from helper.tools import think_tool, ConductResearch, ResearchComplete
 from helper.ui import UI
-from helper.utils import get_today_str, get_notes_from_tool_calls
-from dotenv import load_dotenv
+from helper.utils import get_today_str
+from helper.model_pool import ModelPool, get_model
 
-load_dotenv()   
+supervisor_tool_list = [ConductResearch, ResearchComplete, think_tool]
 
-supervisor_tools = [ConductResearch, ResearchComplete, think_tool]
-supervisor_model = init_chat_model(model="openai:gpt-5-mini", temperature=0.0)
-supervisor_model_with_tools = supervisor_model.bind_tools(supervisor_tools)
+@lru_cache(maxsize=1)
+def get_supervisor_model_with_tools() -> ModelPool:
+    """Get the supervisor model with its tools bound, initializing it on first use."""
+    return get_model("openai:gpt-5-mini", temperature=0.0).bind_tools(supervisor_tool_list)
 
 # System constants
 # Maximum number of tool call iterations for individual researcher agents
@@ -67,6 +68,7 @@ async def supervisor(state: SupervisorState) -> Command[Literal["supervisor_tool
     )
     
     # Make decision about next research steps
+    supervisor_model_with_tools = get_supervisor_model_with_tools().for_key(state.get("research_brief", ""))
     response = await supervisor_model_with_tools.ainvoke([SystemMessage(content=system_message)] + supervisor_messages)
     
     return Command(
@@ -172,8 +174,8 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
 
                 # Format research results as tool messages
                 # Each sub-agent returns compressed research findings in result["compressed_research"]
-                # We write this compressed research as the content of a ToolMessage, which allows
-                # the supervisor to later retrieve these findings via get_notes_from_tool_calls()
+                # We write this compressed research as the content of a ToolMessage, which is also
+                # recorded in tool_notes so the findings can be handed over as notes at the end
                 research_tool_messages = [
                     ToolMessage(
                         content=result.get("compressed_research", "Error synthesizing research report"),
@@ -195,7 +197,7 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
         return Command(
             goto=next_step,
             update={
-                "notes": get_notes_from_tool_calls(supervisor_messages),
+                "notes": state.get("tool_notes", []),
                 "research_brief": state.get("research_brief", "")
             }
         )
@@ -204,6 +206,7 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
             goto=next_step,
             update={
                 "supervisor_messages": tool_messages,
+                "tool_notes": [tool_message.content for tool_message in tool_messages],
             }
         )
 
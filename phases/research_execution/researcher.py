@@ -3,17 +3,16 @@ The agent will execute different tools (which will create a chain of reasoning a
 This will happen iteratively until the agent is satisfied with the result.
 """
 
+import asyncio
+from functools import lru_cache
 from typing_extensions import Literal
-from langchain.chat_models import init_chat_model
 from langgraph.graph import StateGraph, START, END
 from helper.prompts import research_agent_prompt, compress_research_system_prompt, compress_research_human_message
 from helper.state_config import ResearcherState, ResearcherOutputState
 from helper.utils import get_today_str
+from helper.model_pool import ModelPool, get_model
 from langchain_core.messages import ToolMessage, SystemMessage, HumanMessage, filter_messages
 from helper.tools import tavily_search, think_tool
-from dotenv import load_dotenv
-
-load_dotenv()
 
 tools = [
     tavily_search,
@@ -21,9 +20,12 @@ tools = [
 ]
 tools_by_name = {tool.name: tool for tool in tools}
 
-model = init_chat_model(model="openai:gpt-5-mini", temperature=0.0)
-model_with_tools = model.bind_tools(tools)
-compress_model = init_chat_model(model="openai:gpt-5-mini", temperature=0.0)
+researcher_model_name = "openai:gpt-5-mini"
+
+@lru_cache(maxsize=1)
+def get_model_with_tools() -> ModelPool:
+    """Get the researcher model with its tools bound, initializing it on first use."""
+    return get_model(researcher_model_name, temperature=0.0).bind_tools(tools)
 
 def llm_call(state: ResearcherState):
     """Analyze current state and decide on next actions.
@@ -36,25 +38,25 @@ def llm_call(state: ResearcherState):
     """
     return {
         "researcher_messages": [
-            model_with_tools.invoke(
+            get_model_with_tools().for_key(state.get("research_topic", "")).invoke(
                 [SystemMessage(content=research_agent_prompt)] + state["researcher_messages"]
             )
         ]
     }
 
-def tool_node(state: ResearcherState):
+async def tool_node(state: ResearcherState):
     """Execute all tool calls from the previous LLM response.
     
-    Executes all tool calls from the previous LLM responses.
+    Executes all tool calls from the previous LLM responses concurrently.
     Returns updated state with tool execution results.
     """
     tool_calls = state["researcher_messages"][-1].tool_calls
  
-    # Execute all tool calls
-    observations = []
-    for tool_call in tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observations.append(tool.invoke(tool_call["args"]))
+    # Execute all tool calls at once; results come back in tool call order
+    observations = await asyncio.gather(*(
+        tools_by_name[tool_call["name"]].ainvoke(tool_call["args"])
+        for tool_call in tool_calls
+    ))
             
     # Create tool message outputs
     tool_outputs = [
@@ -76,6 +78,7 @@ def compress_research(state: ResearcherState) -> dict:
     
     system_message = compress_research_system_prompt.format(date=get_today_str())
     messages = [SystemMessage(content=system_message)] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
+    compress_model = get_model(researcher_model_name, temperature=0.0).for_key(state.get("research_topic", ""))
     response = compress_model.invoke(messages)
     
     return {
@@ -3,66 +3,208 @@
 This module implements the final report generation phase of the research workflow, where we:
 1. Synthesize all research findings into a comprehensive final report
 2. Generate the final report using the research brief and findings
-3. Save the final report to cloud storage (Supabase)
+3. Save the final report to local disk or cloud storage (Supabase), depending on STORAGE_BACKEND
+
+The report is drafted speculatively while the supervisor is still researching: whenever
+new notes arrive a fresh draft is started, and the draft is kept if the notes did not
+change afterwards. This takes the report generation latency off the critical path.
 """
 
+import asyncio
 import os
-from supabase import create_client, Client
+from supabase import acreate_client, AsyncClient
 from datetime import datetime
-from langchain_core.messages import HumanMessage
+from pathlib import Path
+from string import Formatter
+from langchain_core.messages import HumanMessage, ToolMessage
 
-from helper.utils import get_today_str
+from helper.utils import get_today_str, truncate_notes_by_tokens
 from helper.prompts import final_report_generation_prompt
 from helper.state_config import AgentState
+from helper.ui import UI
+from phases.research_execution.lead_researcher import supervisor_agent
+
+from helper.model_pool import get_model
+
+# Writer model settings can be overridden through the environment
+writer_model_name = os.getenv("WRITER_MODEL", "openai:gpt-5-mini")
+writer_max_tokens = int(os.getenv("WRITER_MAX_TOKENS", "16384"))
+
+# Where final reports are saved: "supabase" (cloud storage) or "local" (current directory)
+# Checked at import, so a misconfigured backend fails before any research is done
+storage_backends = {"supabase", "local"}
+storage_backend = os.getenv("STORAGE_BACKEND") or "supabase"
+if storage_backend not in storage_backends:
+    raise ValueError(
+        f"Invalid STORAGE_BACKEND '{storage_backend}': expected one of {sorted(storage_backends)}"
+    )
+
+# Supabase settings are read once; the async client is created on first upload and then reused,
+# so later uploads share its connection pool
+supabase_url = os.getenv("SUPABASE_URL")
+supabase_key = os.getenv("SUPABASE_KEY")
+supabase_client: AsyncClient | None = None
+
+# Maximum tokens of research findings included in the final report prompt
+# When the notes exceed this budget, the oldest notes are dropped
+max_findings_tokens = 100000
 
-from langchain.chat_models import init_chat_model
-writer_model = init_chat_model(model="openai:gpt-5-mini", max_tokens=16384) 
+# The final report prompt is parsed into (literal_text, field_name) pairs once at import,
+# so rendering it is a single join instead of re-scanning the template on every call
+final_report_prompt_parts = [
+    (literal_text, field_name)
+    for literal_text, field_name, _, _ in Formatter().parse(final_report_generation_prompt)
+]
 
-async def final_report_generation(state: AgentState):
+def render_final_report_prompt(**fields: str) -> str:
     """
-    Final report generation node.
-    
-    Synthesizes all research findings into a comprehensive final report
+    Render the pre-parsed final report prompt with the given field values.
     """
-    
-    notes = state.get("notes", [])
-    
-    findings = "\n".join(notes)
+    return "".join(
+        literal_text + (fields[field_name] if field_name is not None else "")
+        for literal_text, field_name in final_report_prompt_parts
+    )
+
+async def generate_final_report(research_brief: str, notes: list[str]) -> str:
+    """
+    Synthesize the research findings into a comprehensive final report.
+    """
+    findings = "\n".join(truncate_notes_by_tokens(notes, max_findings_tokens))
 
-    final_report_prompt = final_report_generation_prompt.format(
-        research_brief=state.get("research_brief", ""),
+    final_report_prompt = render_final_report_prompt(
+        research_brief=research_brief,
         findings=findings,
         date=get_today_str()
     )
     
+    writer_model = get_model(writer_model_name, max_tokens=writer_max_tokens).for_key(research_brief)
     final_report = await writer_model.ainvoke([HumanMessage(content=final_report_prompt)])
     
+    return final_report.content
+
+def count_research_results(supervisor_messages: list) -> int:
+    """
+    Count the ConductResearch results the supervisor has received so far
+    """
+    return sum(
+        1 for message in supervisor_messages
+        if isinstance(message, ToolMessage) and message.name == "ConductResearch"
+    )
+
+def log_discarded_draft_error(draft_task: asyncio.Task) -> None:
+    """
+    Retrieve and report the error of a discarded draft, so it is not lost when the task is dropped
+    """
+    if not draft_task.cancelled() and draft_task.exception() is not None:
+        UI.print_error(f"Discarded report draft failed: {draft_task.exception()}")
+
+def discard_draft(draft_task: asyncio.Task) -> None:
+    """
+    Cancel a report draft that is no longer needed
+    """
+    draft_task.cancel()
+    draft_task.add_done_callback(log_discarded_draft_error)
+
+async def research_and_final_report_generation(state: AgentState):
+    """
+    Research and final report generation node.
+    
+    Runs the supervisor subgraph and drafts the final report speculatively as research
+    results come in. A new draft is only started when new ConductResearch results arrive
+    (think_tool reflections alone don't replace the draft), and the previous draft is
+    cancelled. Once research is complete the latest draft is used as the final report;
+    if no research results arrived at all, the report is generated from the final notes.
+    """
+    research_brief = state.get("research_brief", "")
+    draft_task = None
+    draft_research_results = 0
+    supervisor_state = {}
+    
+    try:
+        async for supervisor_state in supervisor_agent.astream(state, stream_mode="values"):
+            research_results = count_research_results(supervisor_state.get("supervisor_messages", []))
+            if research_results > draft_research_results:
+                if draft_task:
+                    discard_draft(draft_task)
+                draft_research_results = research_results
+                draft_task = asyncio.create_task(
+                    generate_final_report(research_brief, supervisor_state.get("tool_notes", []))
+                )
+        
+        notes = supervisor_state.get("notes", [])
+        if draft_task is None:
+            draft_task = asyncio.create_task(generate_final_report(research_brief, notes))
+        
+        final_report = await draft_task
+    finally:
+        # Never leave a speculative draft running (e.g. if research failed)
+        if draft_task and not draft_task.done():
+            discard_draft(draft_task)
+    
     return {
-        "final_report": final_report.content, 
-        "messages": ["Here is the final report: " + final_report.content],
+        "supervisor_messages": supervisor_state.get("supervisor_messages", []),
+        "notes": notes,
+        "final_report": final_report, 
+        "messages": ["Final report generated (see final_report field)"],
     }
 
-def save_final_report(state: AgentState):
+async def get_supabase_client() -> AsyncClient:
+    """
+    Get the shared async Supabase client, creating it on first use
+    """
+    global supabase_client
+    if supabase_client is None:
+        supabase_client = await acreate_client(supabase_url, supabase_key)
+    return supabase_client
+
+async def save_final_report(state: AgentState):
+    """
+    Save the final report to the configured storage backend (local file or Supabase)
+    """
+    filename = f"final_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+    
+    if storage_backend == "local":
+        return await save_final_report_to_file(state["final_report"], filename)
+    return await upload_final_report_to_supabase(state["final_report"], filename)
+
+async def save_final_report_to_file(final_report: str, filename: str) -> dict:
     """
-    Save the final report to cloud storage (Supabase only)
+    Save the final report to a markdown file in the current directory
+    
+    The report is encoded once and written as bytes in a worker thread, so the write
+    skips text-mode I/O and doesn't block the event loop.
     """
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_KEY")
+    try:
+        path = Path(filename)
+        await asyncio.to_thread(path.write_bytes, final_report.encode("utf-8"))
+        
+        return {
+            "messages": [f"Final report saved to {path.resolve()}"]
+        }
+        
+    except OSError as e:
+        return {
+            "messages": [f"Failed to save final report: {e}"]
+        }
+
+async def upload_final_report_to_supabase(final_report: str, filename: str) -> dict:
+    """
+    Upload the final report to cloud storage (Supabase)
     
+    The public URL is built from the storage path, so the upload is the only network round-trip.
+    """
     if not supabase_url or not supabase_key:
         return {
             "messages": ["Error: SUPABASE_URL and SUPABASE_KEY must be set in environment variables"]
         }
     
     try:
-        supabase: Client = create_client(supabase_url, supabase_key)
-        
-        filename = f"final_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
         storage_path = f"nv-line-agent/{filename}"
         
-        supabase.storage.from_("next-voters-summaries").upload(
+        client = await get_supabase_client()
+        await client.storage.from_("next-voters-summaries").upload(
             path=storage_path,
-            file=state["final_report"].encode('utf-8'),
+            file=final_report.encode('utf-8'),
             file_options={"content-type": "text/markdown"}
         )
         
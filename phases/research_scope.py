@@ -4,57 +4,102 @@ This module implements the scoping phase of the research workflow, where we:
 1. Assess if the user's request needs clarification
 2. Generate a detailed research brief from the conversation
 
+Both steps are normally done in a single LLM call; the separate brief generation
+node is only used as a fallback when that call does not return a brief.
+
 The workflow uses structured output to make deterministic decisions about
 whether sufficient context exists to proceed with research.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing_extensions import Literal
 
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, AIMessage, get_buffer_string
 from langgraph.graph import END
 from langgraph.types import Command
 
-from helper.prompts import clarify_with_user_instructions, transform_messages_into_research_topic_prompt
+from helper.prompts import clarify_or_write_research_brief_prompt, transform_messages_into_research_topic_prompt
 from helper.state_config import ResearchScopeState
-from helper.llm_output_schema_config import ClarifyWithUser, ResearchQuestion
-from dotenv import load_dotenv
-
-load_dotenv()   
+from helper.llm_output_schema_config import ClarifyOrBrief, ResearchQuestion
+from helper.model_pool import ModelPool, get_model
 
 def get_today_str() -> str:
     """Get current date in a human-readable format."""
     return datetime.now().strftime("%a %b %-d, %Y")
 
-model = init_chat_model(model="openai:gpt-5-mini", temperature=0.0)
+scope_model_name = "openai:gpt-5-mini"
 
+def get_conversation_key(messages: list) -> str:
+    """
+    Get the key used to pick the model endpoint for a conversation.
+    
+    Uses the first message, which stays the same for the whole conversation, so every
+    scope call of one conversation goes to the same endpoint and can reuse its prompt cache.
+    """
+    return get_buffer_string(messages[:1])
 
-def clarify_with_user(state: ResearchScopeState) -> Command[Literal["write_research_brief", "__end__"]]:
+@lru_cache(maxsize=1)
+def get_clarify_or_brief_model() -> ModelPool:
+    """Get the scope model returning ClarifyOrBrief, initializing it on first use."""
+    return get_model(scope_model_name, temperature=0.0).with_structured_output(ClarifyOrBrief)
+
+@lru_cache(maxsize=1)
+def get_research_question_model() -> ModelPool:
+    """Get the scope model returning ResearchQuestion, initializing it on first use."""
+    return get_model(scope_model_name, temperature=0.0).with_structured_output(ResearchQuestion)
+
+def clarify_or_write_research_brief(messages_buffer: str, conversation_key: str, date: str) -> ClarifyOrBrief:
     """
-    Determine if the user's request contains sufficient information to proceed with research.
+    Decide whether the conversation needs a clarifying question and, if not, write the research brief.
     
-    Uses structured output to make deterministic decisions and avoid hallucination.
-    Routes to either research brief generation or ends with a clarification question.
+    Both outputs come from a single structured-output call.
     """
-    structured_output_model = model.with_structured_output(ClarifyWithUser)
+    structured_output_model = get_clarify_or_brief_model().for_key(conversation_key)
 
-    response = structured_output_model.invoke([
-        HumanMessage(content=clarify_with_user_instructions.format(
-            messages=get_buffer_string(messages=state["messages"]), 
-            date=get_today_str()
+    return structured_output_model.invoke([
+        HumanMessage(content=clarify_or_write_research_brief_prompt.format(
+            messages=messages_buffer, 
+            date=date
         ))
     ])
+
+
+def clarify_with_user(state: ResearchScopeState) -> Command[Literal["write_research_brief", "__end__"]]:
+    """
+    Determine if the user's request contains sufficient information to proceed with research.
     
-    if response.need_clarification:
+    Uses structured output to make deterministic decisions and avoid hallucination.
+    Ends with either a clarification question or the research brief, which is written
+    in the same LLM call; only routes to research brief generation if no brief was returned.
+    """
+    messages_buffer = get_buffer_string(messages=state["messages"])
+    response = clarify_or_write_research_brief(
+        messages_buffer, get_conversation_key(state["messages"]), get_today_str()
+    )
+    
+    if response["need_clarification"]:
+        return Command(
+            goto=END, 
+            update={"messages": [AIMessage(content=response["question"])]}
+        )
+    elif response.get("research_brief"):
         return Command(
             goto=END, 
-            update={"messages": [AIMessage(content=response.question)]}
+            update={
+                "messages": [AIMessage(content=response["verification"])],
+                "research_brief": response["research_brief"]
+            }
         )
     else:
+        verification = AIMessage(content=response["verification"])
         return Command(
             goto="write_research_brief", 
-            update={"messages": [AIMessage(content=response.verification)]}
+            update={
+                "messages": [verification],
+                # Extend the buffer with the new message instead of rebuilding it from the whole history
+                "messages_buffer": messages_buffer + "\n" + get_buffer_string([verification])
+            }
         )
 
 def write_research_brief(state: ResearchScopeState):
@@ -64,16 +109,17 @@ def write_research_brief(state: ResearchScopeState):
     Uses structured output to ensure the brief follows the required format
     and contains all necessary details for effective research.
     """
-    structured_output_model = model.with_structured_output(ResearchQuestion)
+    messages_buffer = state.get("messages_buffer") or get_buffer_string(state.get("messages", []))
+    structured_output_model = get_research_question_model().for_key(get_conversation_key(state.get("messages", [])))
     
     response = structured_output_model.invoke([
         HumanMessage(content=transform_messages_into_research_topic_prompt.format(
-            messages=get_buffer_string(state.get("messages", [])),
+            messages=messages_buffer,
             date=get_today_str()
         ))
     ])
     
     # Update state with generated research brief and pass it to the supervisor
     return {
-        "research_brief": response.research_brief
+        "research_brief": response["research_brief"]
     }